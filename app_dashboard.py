@@ -6,12 +6,12 @@ import numpy as np
 
 # --- MODULE IMPORTS ---
 from data_processor import TLEProcessor
+from catalog_index import CatalogIndex
 from mission_engine import OrbitalMechanics
-from rl_pilot import AdvancedRLPilot
 from ga_optimizer import MissionOptimizer
 from system_analytics import SystemValidator
+from mc_cache import MonteCarloCache
 from subsystem_manager import PowerThermalSubsystem
-from entropy_engine import EntropyEngine
 from graphics_engine import TacticalDisplay
 from model_3d import SatelliteModel  # 3D Visuals
 
@@ -34,6 +34,11 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+# --- CATALOG INDEX (built once per session, reused by every filter interaction) ---
+@st.cache_resource
+def load_catalog_index():
+    return CatalogIndex(TLEProcessor().load_catalog())
+
 # --- SIDEBAR ---
 st.sidebar.image("https://img.icons8.com/color/96/satellite-in-orbit.png", width=80)
 st.sidebar.title("Orbital Command")
@@ -60,11 +65,10 @@ if page == "1. Command Center":
         st.plotly_chart(sat_fig, use_container_width=True, config={'displayModeBar': False})
         
     with col_stats:
-        processor = TLEProcessor()
-        catalog = processor.load_catalog()
+        index = load_catalog_index()
         
         m1, m2 = st.columns(2)
-        m1.metric("Active Assets", len(catalog))
+        m1.metric("Active Assets", len(index))
         
         # REALISM: Simulated Ground Station Pass
         import time
@@ -81,14 +85,22 @@ if page == "1. Command Center":
         m4.metric("Collision Risk", "LOW")
 
     st.markdown("### 📡 Fleet Distribution")
-    if len(catalog) > 0:
-        sat_data = []
-        for name, sat in list(catalog.items())[:500]: 
-            try:
-                sat_data.append({"Name": name, "Mean Motion": sat.model.no_kozai, "Inclination": np.degrees(sat.model.inclo)})
-            except: pass
+    if len(index) > 0:
+        f1, f2, f3 = st.columns(3)
+        name_prefix = f1.text_input("Name prefix", placeholder="STARLINK-*")
+        alt_lo, alt_hi = f2.slider("Altitude (km)", 0, 40000, (0, 40000), step=50)
+        inc_lo, inc_hi = f3.slider("Inclination (deg)", 0.0, 180.0, (0.0, 180.0), step=0.5)
+        
+        hits = index.query(
+            prefix=name_prefix or None,
+            altitude_km=(alt_lo or None, alt_hi if alt_hi < 40000 else None), # Open-ended at the slider limits
+            inclination_deg=(inc_lo, inc_hi)
+        )
+        st.caption(f"{len(hits)} of {len(index)} objects match")
         
-        df = pd.DataFrame(sat_data)
+        df = pd.DataFrame(index.frame(hits[:5000])).rename(
+            columns={"mean_motion": "Mean Motion", "inclination_deg": "Inclination"}
+        )
         fig = px.scatter(df, x="Mean Motion", y="Inclination", color="Inclination", title="Orbit Catalog", color_continuous_scale="Bluered")
         fig.update_layout(paper_bgcolor="white", plot_bgcolor="white", font=dict(color="#1f2937"))
         st.plotly_chart(fig, use_container_width=True)
@@ -104,46 +116,26 @@ elif page == "2. Flight Dynamics (GNC)":
         st.session_state['run_sim'] = True
     
     if st.session_state.get('run_sim', False):
-        pilot = AdvancedRLPilot()
-        murphy = EntropyEngine()
-        history = []
-        
         progress_bar = st.progress(0)
         status_text = st.empty()
         
         # Simulation Loop
-        steps = 1500
-        for i in range(steps):
-            history.append(pilot.state.copy())
-            
-            # REALISM: Add Sensor Noise
-            input_state = murphy.inject_noise(pilot.state)
-            
-            # CONTROL: Smooth the thrust (Simple Gain Dampening)
-            thrust = pilot.get_control_effort(input_state) * 0.8 # Dampen to prevent zigzag
-            
-            # PHYSICS
-            accel = thrust / pilot.mass
-            pilot.state[3:] += accel * pilot.dt
-            pilot.state[:3] += pilot.state[3:] * pilot.dt
-            pilot.total_delta_v += (np.linalg.norm(thrust)/pilot.mass)*pilot.dt
-            
-            dist = np.linalg.norm(pilot.state[:3])
-            
-            # REALISM: Docking Tolerance
-            if dist < 0.02: # 2cm precision
-                status_text.success(f"✅ HARD DOCK CONFIRMED. T={i*0.1:.1f}s")
-                progress_bar.progress(100)
-                break
-            
-            if i % 100 == 0:
-                progress_bar.progress(int((i/steps)*100))
+        result = SystemValidator.run_docking_scenario(
+            steps=1500,
+            on_progress=lambda i, steps: progress_bar.progress(int((i/steps)*100))
+        )
+        history = result["history"]
+        dist = result["final_range"]
+        
+        if result["docked"]:
+            status_text.success(f"✅ HARD DOCK CONFIRMED. T={result['dock_time_s']:.1f}s")
+            progress_bar.progress(100)
         
         fig_3d = TacticalDisplay.create_3d_plot(history)
         st.plotly_chart(fig_3d, use_container_width=True)
         
         m1, m2 = st.columns(2)
-        m1.metric("Delta-V Used", f"{pilot.total_delta_v:.2f} m/s")
+        m1.metric("Delta-V Used", f"{result['delta_v']:.2f} m/s")
         m2.metric("Final Range", f"{dist*100:.1f} cm")
 
 # ==============================================================================
@@ -153,9 +145,24 @@ elif page == "3. Certification (IV&V)":
     st.title("📊 Reliability Engineering")
     st.markdown("Independent Verification & Validation (IV&V).")
     
+    c_trials, c_seed = st.columns(2)
+    n_trials = c_trials.number_input("Trials", min_value=10, max_value=10000, value=50, step=10)
+    seed = c_seed.number_input("Seed", min_value=0, value=42, step=1)
+    adaptive = st.checkbox("Adaptive stopping (trial count becomes the maximum budget)")
+    
     if st.button("RUN MONTE CARLO SUITE"):
-        with st.spinner("Running 50 stochastic simulations..."):
-            stats = SystemValidator.run_monte_carlo(50)
+        # Cached trials are reused; only trials beyond the stored count are flown
+        with st.spinner(f"Running up to {n_trials} stochastic simulations..."):
+            if adaptive:
+                stats = SystemValidator.run_adaptive(int(n_trials), seed=int(seed), cache=MonteCarloCache())
+            else:
+                stats = SystemValidator.run_monte_carlo(int(n_trials), seed=int(seed), cache=MonteCarloCache())
+        
+        if adaptive:
+            verdict = "settled" if stats['settled'] else "NOT settled (budget exhausted)"
+            st.info(f"Decision {verdict} at {stats['confidence']:.0%} confidence after "
+                    f"{stats['trials_used']} trials ({stats['trials_saved']} saved). "
+                    f"3-sigma bound CI: [{stats['ci_low']:.2f}%, {stats['ci_high']:.2f}%]")
         
         # REALISM: Flight Certification Metrics
         kpi1, kpi2, kpi3 = st.columns(3)
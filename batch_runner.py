@@ -0,0 +1,273 @@
+"""
+Headless Batch Runner.
+
+Runs optimizer, Monte Carlo, docking and power-budget jobs from a JSON job spec
+without a Streamlit session, on a bounded pool of worker processes.
+
+    python batch_runner.py jobs.json -o results.jsonl --workers 8 --timeout 900
+
+Job spec (a list of jobs, or {"defaults": {...}, "jobs": [...]}):
+
+    {"defaults": {"timeout": 600},
+     "jobs": [
+        {"id": "cert-a", "type": "monte_carlo", "params": {"iterations": 500, "seed": 1}},
+        {"id": "cert-b", "type": "monte_carlo", "params": {"max_iterations": 5000, "adaptive": true}},
+        {"id": "dock-1", "type": "docking", "params": {"seed": 7, "steps": 1500}},
+        {"id": "orbit", "type": "optimizer", "params": {"pop_size": 40, "seed": 3}},
+        {"id": "pwr", "type": "power", "params": {"duration_s": 11400, "eclipse_fraction": 0.35}},
+        {"id": "fleet", "type": "fleet_power", "params": {"altitude_km": [550, 1200], "inclination_deg": [53, 87.9],
+                                                          "epoch_jd": 2460311.0}}
+     ]}
+
+Each finished job is appended as one JSON record to the output (JSON Lines),
+or written as a single JSON array when the output path ends in '.json'.
+"""
+import argparse
+import json
+import logging
+import multiprocessing as mp
+import os
+import random
+import sys
+import time
+import traceback
+from collections import deque
+from multiprocessing.connection import wait
+
+import numpy as np
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("Batch_Runner")
+
+DEFAULT_TIMEOUT = 3600.0 # s per job
+
+# ==============================================================================
+# JOB HANDLERS (run inside worker processes)
+# ==============================================================================
+def _job_monte_carlo(iterations=50, seed=None, adaptive=False, max_iterations=5000,
+                     confidence=0.99, cache_dir='.mc_cache', precision="float64"):
+    from system_analytics import SystemValidator
+    from mc_cache import MonteCarloCache
+    cache = MonteCarloCache(cache_dir) if cache_dir else None
+
+    if adaptive:
+        stats = SystemValidator.run_adaptive(max_iterations, confidence=confidence, seed=seed,
+                                             cache=cache, precision=precision)
+    else:
+        stats = SystemValidator.run_monte_carlo(iterations, seed=seed, cache=cache, precision=precision)
+    return stats
+
+def _job_docking(steps=1500, thrust_gain=0.8, tolerance=0.02, seed=None, record_history=False):
+    from system_analytics import SystemValidator
+    result = SystemValidator.run_docking_scenario(steps, thrust_gain, tolerance, rng=np.random.default_rng(seed))
+    if not record_history:
+        result.pop("history")
+    return result
+
+def _job_optimizer(pop_size=50, seed=None):
+    from ga_optimizer import MissionOptimizer
+    if seed is not None:
+        random.seed(seed)
+    best_alt, best_cost = MissionOptimizer(pop_size=pop_size).run()
+    return {"best_altitude_km": best_alt, "best_cost": best_cost}
+
+def _job_power(duration_s=5700.0, dt=10.0, orbit_period_s=5700.0, eclipse_fraction=0.35,
+               thrust_duty=0.0):
+    from subsystem_manager import PowerThermalSubsystem
+    eps = PowerThermalSubsystem()
+
+    n_steps = int(duration_s / dt)
+    charge = np.zeros(n_steps)
+    temp = np.zeros(n_steps)
+    for i in range(n_steps):
+        # Eclipse occupies the last part of each orbit; thrusting the first part
+        phase = ((i * dt) % orbit_period_s) / orbit_period_s
+        telemetry = eps.update(dt, phase >= 1.0 - eclipse_fraction, phase < thrust_duty)
+        charge[i] = telemetry["charge_pct"]
+        temp[i] = telemetry["temp_c"]
+
+    return {
+        "min_charge_pct": charge.min(),
+        "final_charge_pct": charge[-1],
+        "min_temp_c": temp.min(),
+        "max_temp_c": temp.max(),
+    }
+
+def _job_fleet_power(altitude_km, inclination_deg=0.0, raan_deg=0.0, phase_deg=0.0,
+                     epoch_jd=2451545.0, duration_s=86400.0, dt=30.0, model="conical"):
+    from eclipse_engine import EclipseEngine
+    from subsystem_manager import PowerThermalSubsystem
+
+    # Orbit parameters may be scalars or per-satellite lists
+    times = np.arange(0.0, duration_s, dt)
+    positions = EclipseEngine.circular_orbit_positions(altitude_km, inclination_deg, raan_deg, times, phase_deg)
+    r_sun = EclipseEngine.sun_position_eci(epoch_jd + times / 86400.0)
+    illum = EclipseEngine.illumination(positions, r_sun, model)
+
+    budget = PowerThermalSubsystem().simulate_fleet(illum, dt)
+    umbra, penumbra = EclipseEngine.shadow_fractions(illum)
+    events = EclipseEngine.eclipse_events(times, EclipseEngine.shadow_margin(positions, r_sun, model))
+
+    return {
+        "umbra_fraction": umbra,
+        "penumbra_fraction": penumbra,
+        "eclipse_events": [ev.tolist() for ev in events],
+        "min_charge_pct": budget["charge_pct"].min(axis=1),
+        "final_charge_pct": budget["charge_pct"][:, -1],
+        "min_temp_c": budget["temp_c"].min(axis=1),
+        "max_temp_c": budget["temp_c"].max(axis=1),
+    }
+
+JOB_TYPES = {
+    "monte_carlo": _job_monte_carlo,
+    "docking": _job_docking,
+    "optimizer": _job_optimizer,
+    "power": _job_power,
+    "fleet_power": _job_fleet_power,
+}
+
+def _json_default(obj):
+    # NumPy scalars / arrays are not JSON serializable by default
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _worker(job, conn):
+    try:
+        result = JOB_TYPES[job["type"]](**job.get("params", {}))
+        conn.send({"status": "ok", "result": result})
+    except Exception as e:
+        conn.send({"status": "error", "error": f"{type(e).__name__}: {e}", "traceback": traceback.format_exc()})
+    finally:
+        conn.close()
+
+# ==============================================================================
+# SCHEDULER
+# ==============================================================================
+class BatchRunner:
+    """
+    Bounded process pool: at most 'workers' jobs in flight, one process per job
+    so a job that overruns its timeout can be terminated without losing the pool.
+    """
+    def __init__(self, workers=None, default_timeout=DEFAULT_TIMEOUT):
+        self.workers = workers or os.cpu_count() or 1
+        self.default_timeout = default_timeout
+        self.ctx = mp.get_context()
+
+    @staticmethod
+    def load_spec(path):
+        """
+        Reads a job spec and returns a validated list of job dicts.
+        """
+        with open(path, 'r') as f:
+            spec = json.load(f)
+
+        if isinstance(spec, list):
+            spec = {"jobs": spec}
+        defaults = spec.get("defaults", {})
+
+        jobs = []
+        for n, raw in enumerate(spec.get("jobs", [])):
+            job = {**defaults, **raw}
+            job.setdefault("id", f"job-{n}")
+            job.setdefault("params", {})
+            if job.get("type") not in JOB_TYPES:
+                raise ValueError(f"Job '{job['id']}': unknown type {job.get('type')!r} "
+                                 f"(expected one of {sorted(JOB_TYPES)})")
+            jobs.append(job)
+        return jobs
+
+    def _start(self, job):
+        recv_conn, send_conn = self.ctx.Pipe(duplex=False)
+        proc = self.ctx.Process(target=_worker, args=(job, send_conn), daemon=True)
+        proc.start()
+        send_conn.close()
+
+        timeout = job.get("timeout", self.default_timeout)
+        return {"job": job, "proc": proc, "conn": recv_conn, "start": time.time(),
+                "deadline": time.time() + timeout}
+
+    @staticmethod
+    def _record(slot, status, **fields):
+        job = slot["job"]
+        return {"id": job["id"], "type": job["type"], "status": status,
+                "elapsed_s": round(time.time() - slot["start"], 3),
+                "params": job["params"], **fields}
+
+    def run(self, jobs):
+        """
+        Yields one result record per job, in completion order.
+        """
+        pending = deque(jobs)
+        running = []
+
+        while pending or running:
+            # 1. Fill free worker slots
+            while pending and len(running) < self.workers:
+                running.append(self._start(pending.popleft()))
+
+            # 2. Sleep until a job reports, a worker exits, or the nearest deadline
+            now = time.time()
+            next_deadline = min(slot["deadline"] for slot in running)
+            handles = [slot["conn"] for slot in running] + [slot["proc"].sentinel for slot in running]
+            wait(handles, timeout=max(0.0, next_deadline - now))
+
+            # 3. Collect finished / crashed / overdue jobs
+            still_running = []
+            for slot in running:
+                record = None
+                if slot["conn"].poll():
+                    try:
+                        msg = slot["conn"].recv()
+                        record = self._record(slot, **msg)
+                    except EOFError:
+                        record = self._record(slot, "error", error="Worker exited without a result")
+                elif not slot["proc"].is_alive():
+                    record = self._record(slot, "error", error=f"Worker died (exit code {slot['proc'].exitcode})")
+                elif time.time() >= slot["deadline"]:
+                    slot["proc"].terminate()
+                    record = self._record(slot, "timeout", error="Job exceeded its timeout")
+
+                if record is None:
+                    still_running.append(slot)
+                    continue
+                slot["proc"].join()
+                slot["conn"].close()
+                yield record
+            running = still_running
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Orbital Command headless batch runner")
+    parser.add_argument("spec", help="JSON job spec")
+    parser.add_argument("-o", "--output", default="results.jsonl",
+                        help="Results file (.jsonl streams records, .json writes one array)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Max concurrent jobs (default: all cores)")
+    parser.add_argument("-t", "--timeout", type=float, default=DEFAULT_TIMEOUT, help="Default per-job timeout (s)")
+    args = parser.parse_args(argv)
+
+    jobs = BatchRunner.load_spec(args.spec)
+    runner = BatchRunner(args.workers, args.timeout)
+    logger.info(f"Running {len(jobs)} jobs on {runner.workers} workers")
+
+    as_array = args.output.endswith('.json')
+    records = []
+    failures = 0
+    with open(args.output, 'w') as f:
+        for record in runner.run(jobs):
+            logger.info(f"{record['id']}: {record['status']} ({record['elapsed_s']:.1f}s)")
+            failures += record["status"] != "ok"
+            if as_array:
+                records.append(record)
+            else:
+                f.write(json.dumps(record, default=_json_default) + "\n")
+                f.flush()
+        if as_array:
+            json.dump(records, f, default=_json_default, indent=2)
+
+    logger.info(f"Done: {len(jobs) - failures} ok, {failures} failed -> {args.output}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+import numpy as np
+
+class CampaignBuffers:
+    """
+    Structure-of-Arrays Storage for Large Simulation Campaigns.
+    One contiguous block per quantity (trial-major) instead of 6-vectors and
+    6x6 matrices scattered across per-trial objects. Pilots and filters are
+    bound to row views, so their in-place updates land directly in the buffers.
+    """
+    __slots__ = ("dtype", "n_trials", "history_stride", "state", "estimate",
+                 "covariance", "history", "history_len", "accuracy", "fuel")
+
+    def __init__(self, n_trials, max_steps, dtype=np.float32, record_history=False, history_stride=10):
+        self.dtype = np.dtype(dtype)
+        self.n_trials = n_trials
+        self.history_stride = history_stride
+
+        # --- LIVE STATE (one row per trial) ---
+        self.state = np.zeros((n_trials, 6), dtype=self.dtype)
+        self.estimate = np.zeros((n_trials, 6), dtype=self.dtype)
+        self.covariance = np.zeros((n_trials, 6, 6), dtype=self.dtype)
+
+        # --- TRAJECTORY HISTORY (every history_stride-th step) ---
+        n_samples = -(-max_steps // history_stride) if record_history else 0
+        self.history = np.zeros((n_trials, n_samples, 6), dtype=self.dtype)
+        self.history_len = np.zeros(n_trials, dtype=np.int32)
+
+        # --- SCORES ---
+        self.accuracy = np.zeros(n_trials)
+        self.fuel = np.zeros(n_trials)
+
+    def bind(self, i, pilot):
+        """
+        Moves the pilot's truth state and its filter's state/covariance into row i
+        and points the objects at those rows.
+        """
+        self.state[i] = pilot.state
+        pilot.state = self.state[i]
+        self.estimate[i] = pilot.estimator.state
+        pilot.estimator.state = self.estimate[i]
+        self.covariance[i] = pilot.estimator.P
+        pilot.estimator.P = self.covariance[i]
+
+    def record(self, i, step):
+        if step % self.history_stride == 0 and self.history.shape[1]:
+            n = step // self.history_stride
+            self.history[i, n] = self.state[i]
+            self.history_len[i] = n + 1
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, name).nbytes for name in
+                   ("state", "estimate", "covariance", "history", "history_len", "accuracy", "fuel"))
@@ -0,0 +1,142 @@
+import bisect
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from skyfield.api import EarthSatellite
+from mission_engine import MU, R_EARTH
+
+class CatalogIndex:
+    """
+    Sorted-Array Query Layer over the TLE Catalog.
+    Element columns are extracted once into NumPy arrays; range queries use
+    binary search on pre-sorted copies and name queries use a sorted prefix index.
+    Every query returns a compact int32 array of row indices into the catalog.
+    """
+    FIELDS = ("altitude_km", "perigee_km", "apogee_km", "inclination_deg",
+              "eccentricity", "mean_motion", "raan_deg", "epoch_jd")
+
+    def __init__(self, catalog: Dict[str, EarthSatellite]):
+        self.names = np.array(list(catalog.keys()), dtype=object)
+        self.satellites = list(catalog.values())
+        self.columns = self._extract_columns(self.satellites)
+
+        # --- SORTED ELEMENT ARRAYS ---
+        # NaNs (undecodable elements) sort to the end and are excluded from range hits
+        self._order = {}
+        self._sorted = {}
+        self._n_valid = {}
+        for field, values in self.columns.items():
+            order = np.argsort(values, kind='stable').astype(np.int32)
+            self._order[field] = order
+            self._sorted[field] = values[order]
+            self._n_valid[field] = int(np.count_nonzero(~np.isnan(values)))
+
+        # --- NAME PREFIX INDEX ---
+        keys = [self._name_key(name) for name in self.names]
+        self._name_order = np.array(sorted(range(len(keys)), key=keys.__getitem__), dtype=np.int32)
+        self._sorted_keys = [keys[i] for i in self._name_order]
+
+    @staticmethod
+    def _name_key(name: str) -> str:
+        # 3LE name lines carry a leading '0 ' line number
+        name = name.strip().upper()
+        return name[2:] if name.startswith('0 ') else name
+
+    @staticmethod
+    def _extract_columns(satellites: List[EarthSatellite]) -> Dict[str, np.ndarray]:
+        n = len(satellites)
+        no_kozai = np.full(n, np.nan)
+        ecco = np.full(n, np.nan)
+        inclo = np.full(n, np.nan)
+        nodeo = np.full(n, np.nan)
+        epoch = np.full(n, np.nan)
+        for i, sat in enumerate(satellites):
+            m = sat.model
+            no_kozai[i] = m.no_kozai
+            ecco[i] = m.ecco
+            inclo[i] = m.inclo
+            nodeo[i] = m.nodeo
+            epoch[i] = m.jdsatepoch + m.jdsatepochF
+
+        # Skyfield no_kozai is in radians/minute -> semi-major axis (km)
+        n_rad_sec = np.where(no_kozai > 0, no_kozai / 60.0, np.nan)
+        a = (MU / n_rad_sec ** 2) ** (1 / 3)
+
+        return {
+            "altitude_km": a - R_EARTH,
+            "perigee_km": a * (1 - ecco) - R_EARTH,
+            "apogee_km": a * (1 + ecco) - R_EARTH,
+            "inclination_deg": np.degrees(inclo),
+            "eccentricity": ecco,
+            "mean_motion": no_kozai,
+            "raan_deg": np.degrees(nodeo),
+            "epoch_jd": epoch,
+        }
+
+    def __len__(self):
+        return len(self.satellites)
+
+    def _bounds(self, field: str, lo: Optional[float], hi: Optional[float]) -> Tuple[int, int]:
+        if field not in self._sorted:
+            raise KeyError(f"Unknown field '{field}' (expected one of {self.FIELDS})")
+        values = self._sorted[field]
+        n_valid = self._n_valid[field]
+        start = 0 if lo is None else int(np.searchsorted(values[:n_valid], lo, side='left'))
+        stop = n_valid if hi is None else int(np.searchsorted(values[:n_valid], hi, side='right'))
+        return start, max(start, stop)
+
+    def range(self, field: str, lo: Optional[float] = None, hi: Optional[float] = None) -> np.ndarray:
+        """
+        Rows with lo <= field <= hi (either bound may be None), in catalog order.
+        """
+        start, stop = self._bounds(field, lo, hi)
+        return np.sort(self._order[field][start:stop])
+
+    def query(self, prefix: Optional[str] = None, **bounds: Tuple[Optional[float], Optional[float]]) -> np.ndarray:
+        """
+        Compound query, e.g. query(altitude_km=(500, 600), inclination_deg=(97, None), prefix="STARLINK").
+        The most selective bound is answered by binary search; the rest are NumPy masks
+        over that candidate set only.
+        """
+        spans = {field: self._bounds(field, *b) for field, b in bounds.items()}
+        if prefix is not None:
+            candidates = self.prefix(prefix)
+        elif spans:
+            field = min(spans, key=lambda f: spans[f][1] - spans[f][0])
+            start, stop = spans.pop(field)
+            candidates = np.sort(self._order[field][start:stop])
+        else:
+            return np.arange(len(self), dtype=np.int32)
+
+        for field in spans:
+            lo, hi = bounds[field]
+            values = self.columns[field][candidates]
+            mask = ~np.isnan(values)
+            if lo is not None:
+                mask &= values >= lo
+            if hi is not None:
+                mask &= values <= hi
+            candidates = candidates[mask]
+        return candidates
+
+    def prefix(self, prefix: str) -> np.ndarray:
+        """
+        Rows whose name starts with prefix (case-insensitive; a trailing '*' is accepted).
+        """
+        key = self._name_key(prefix).rstrip('*')
+        start = bisect.bisect_left(self._sorted_keys, key)
+        stop = bisect.bisect_left(self._sorted_keys, key + '\uffff')
+        return np.sort(self._name_order[start:stop])
+
+    def names_of(self, idx: np.ndarray) -> np.ndarray:
+        return self.names[idx]
+
+    def satellites_of(self, idx: np.ndarray) -> List[EarthSatellite]:
+        return [self.satellites[i] for i in idx]
+
+    def frame(self, idx: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Column-oriented slice of the selected rows (ready for pd.DataFrame).
+        """
+        data = {"Name": self.names[idx]}
+        data.update({field: values[idx] for field, values in self.columns.items()})
+        return data
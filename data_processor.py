@@ -1,41 +1,217 @@
 import logging
 import os
-from typing import Dict
+from collections import Counter
+from collections import deque
+from multiprocessing import Pool
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+from sgp4.api import Satrec
 from skyfield.api import EarthSatellite, load
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("TLE_Ingest")
 
+CHUNK_BYTES = 64 * 1024 * 1024 # Archive split size per worker task
+
+Record = Tuple[str, str, str] # (name, line1, line2)
+
+# Parsed element columns returned by archive workers (Satrec fields, SGP4 units)
+ELEMENT_COLUMNS = ("epoch_jd", "no_kozai", "ecco", "inclo", "nodeo", "argpo", "mo", "bstar")
+
+def _checksum_ok(line: str) -> bool:
+    """
+    TLE modulo-10 checksum: digits count at face value, '-' counts as 1.
+    """
+    if len(line) < 69 or not line[68].isdigit():
+        return False
+    total = sum(int(c) if c.isdigit() else (1 if c == '-' else 0) for c in line[:68])
+    return total % 10 == int(line[68])
+
+def _iter_lines(f, end: Optional[int]) -> Iterator[Tuple[int, str]]:
+    # Binary reads keep byte offsets exact for chunking
+    while end is None or f.tell() < end:
+        offset = f.tell()
+        raw = f.readline()
+        if not raw:
+            return
+        line = raw.decode('ascii', errors='ignore').strip()
+        if line:
+            yield offset, line
+
+def _frame_records(lines: Iterator[Tuple[int, str]], rejected: Counter) -> Iterator[Record]:
+    """
+    Groups a line stream into 3-line (name, 1, 2) records. Lines that do not
+    belong to a complete record are counted as 'unframed'.
+    """
+    window = []
+    for offset, line in lines:
+        window.append((offset, line))
+        if len(window) < 3:
+            continue
+        if window[1][1].startswith('1 ') and window[2][1].startswith('2 '):
+            yield window[0][1], window[1][1], window[2][1]
+            window = []
+        else:
+            window.pop(0)
+            rejected["unframed"] += 1
+    rejected["unframed"] += len(window)
+
+def _parse_chunk(args) -> Tuple[List[Record], np.ndarray, Counter]:
+    """
+    Worker task: parses every record in [start, end) of the archive with SGP4's
+    Satrec and returns the accepted records with their element columns, so the
+    parent never has to parse them again.
+    """
+    filepath, start, end, verify_checksum = args
+    rejected = Counter()
+
+    records, rows = [], []
+    with open(filepath, 'rb') as f:
+        f.seek(start)
+        for name, l1, l2 in _frame_records(_iter_lines(f, end), rejected):
+            if verify_checksum and not (_checksum_ok(l1) and _checksum_ok(l2)):
+                rejected["checksum"] += 1
+                continue
+            try:
+                m = Satrec.twoline2rv(l1, l2)
+            except Exception:
+                rejected["parse_error"] += 1
+                continue
+            # SGP4 flags most malformed element sets via .error instead of raising
+            if m.error != 0:
+                rejected["parse_error"] += 1
+                continue
+            records.append((name, l1, l2))
+            rows.append((m.jdsatepoch + m.jdsatepochF, m.no_kozai, m.ecco, m.inclo,
+                         m.nodeo, m.argpo, m.mo, m.bstar))
+
+    elements = np.array(rows, dtype=np.float64).reshape(-1, len(ELEMENT_COLUMNS))
+    return records, elements, rejected
+
 class TLEProcessor:
-    def __init__(self, filepath: str = 'spacetrack_full_catalog.3le.txt'):
+    def __init__(self, filepath: str = 'spacetrack_full_catalog.3le.txt', verify_checksum: bool = False):
         self.filepath = filepath
+        self.verify_checksum = verify_checksum
         self.ts = load.timescale()
 
+        # --- INGEST STATS (per reason, reset on every pass) ---
+        self.accepted = 0
+        self.rejected = Counter()
+
+    def iter_records(self, start: int = 0, end: Optional[int] = None) -> Iterator[Record]:
+        """
+        Streams raw (name, line1, line2) records whose name line starts in
+        [start, end), holding only one record in memory at a time.
+        """
+        with open(self.filepath, 'rb') as f:
+            f.seek(start)
+            yield from _frame_records(_iter_lines(f, end), self.rejected)
+
+    def _iter_validated(self, start: int = 0, end: Optional[int] = None):
+        for name, l1, l2 in self.iter_records(start, end):
+            if self.verify_checksum and not (_checksum_ok(l1) and _checksum_ok(l2)):
+                self.rejected["checksum"] += 1
+                continue
+            try:
+                sat = EarthSatellite(l1, l2, name, self.ts)
+            except Exception:
+                self.rejected["parse_error"] += 1
+                continue
+            if sat.model.error != 0:
+                self.rejected["parse_error"] += 1
+                continue
+            self.accepted += 1
+            yield sat, l1, l2
+
+    def iter_satellites(self) -> Iterator[EarthSatellite]:
+        """
+        Single-process streaming parse: yields one EarthSatellite per valid element set.
+        """
+        self.accepted = 0
+        self.rejected = Counter()
+        for sat, _, _ in self._iter_validated():
+            yield sat
+
+    def _chunk_boundaries(self, chunk_bytes: int) -> List[int]:
+        """
+        Byte offsets that split the file on 3-line record boundaries.
+        """
+        size = os.path.getsize(self.filepath)
+        bounds = [0]
+        with open(self.filepath, 'rb') as f:
+            for guess in range(chunk_bytes, size, chunk_bytes):
+                if guess <= bounds[-1]:
+                    continue
+                f.seek(guess)
+                f.readline() # Skip the partial line
+                lines = _iter_lines(f, None)
+                window = []
+                for offset, line in lines:
+                    window.append((offset, line))
+                    if len(window) == 3:
+                        if window[1][1].startswith('1 ') and window[2][1].startswith('2 '):
+                            bounds.append(window[0][0])
+                            break
+                        window.pop(0)
+        bounds.append(size)
+        return bounds
+
+    def iter_archive(self, workers: Optional[int] = None,
+                     chunk_bytes: int = CHUNK_BYTES) -> Iterator[Tuple[List[Record], np.ndarray]]:
+        """
+        Multi-process parse of a large (multi-epoch) archive. The file is split on
+        record boundaries and chunks are parsed in a process pool. Yields, per chunk
+        and in file order, the accepted (name, line1, line2) records and an
+        (n, len(ELEMENT_COLUMNS)) float64 array of their parsed elements.
+        At most 2 x workers chunks are in flight, so memory stays bounded however
+        slowly the caller consumes. Rejections are tallied in self.rejected.
+        """
+        self.accepted = 0
+        self.rejected = Counter()
+        if not os.path.exists(self.filepath):
+            logger.error(f"Catalog file missing: {self.filepath}")
+            return
+
+        bounds = self._chunk_boundaries(chunk_bytes)
+        tasks = [(self.filepath, a, b, self.verify_checksum) for a, b in zip(bounds[:-1], bounds[1:])]
+
+        workers = workers or os.cpu_count() or 1
+        with Pool(workers) as pool:
+            pending = deque()
+            for task in tasks:
+                pending.append(pool.apply_async(_parse_chunk, (task,)))
+                if len(pending) < 2 * workers:
+                    continue
+                yield from self._collect_chunk(pending.popleft())
+            while pending:
+                yield from self._collect_chunk(pending.popleft())
+
+        self._log_stats()
+
+    def _collect_chunk(self, result):
+        records, elements, rejected = result.get()
+        self.accepted += len(records)
+        self.rejected.update(rejected)
+        yield records, elements
+
+    def _log_stats(self):
+        n_rejected = sum(self.rejected.values())
+        logger.info(f"Ingested {self.accepted} element sets from {self.filepath}")
+        if n_rejected:
+            logger.warning(f"Rejected {n_rejected} records/lines: {dict(self.rejected)}")
+
     def load_catalog(self) -> Dict[str, EarthSatellite]:
         if not os.path.exists(self.filepath):
             logger.error(f"Catalog file missing: {self.filepath}")
             return {}
-            
+
+        # Later epochs of the same object overwrite earlier ones
         satellites = {}
         try:
-            with open(self.filepath, 'r', errors='ignore') as f:
-                lines = [l.strip() for l in f.readlines() if l.strip()]
-            
-            i = 0
-            while i < len(lines) - 2:
-                if lines[i+1].startswith('1 ') and lines[i+2].startswith('2 '):
-                    name = lines[i]
-                    l1 = lines[i+1]
-                    l2 = lines[i+2]
-                    try:
-                        sat = EarthSatellite(l1, l2, name, self.ts)
-                        satellites[sat.name] = sat
-                    except Exception: 
-                        pass
-                    i += 3
-                else: 
-                    i += 1
-            return satellites
+            for sat in self.iter_satellites():
+                satellites[sat.name] = sat
         except Exception as e:
             logger.error(f"Error parsing TLE: {e}")
-            return {}
\ No newline at end of file
+            return {}
+        self._log_stats()
+        return satellites
@@ -0,0 +1,199 @@
+import numpy as np
+from mission_engine import MU, R_EARTH
+
+# --- SOLAR CONSTANTS ---
+R_SUN = 696000.0     # km
+AU = 149597870.7     # km
+J2000 = 2451545.0    # Julian Date of the J2000 epoch
+
+class EclipseEngine:
+    """
+    Vectorized Eclipse Geometry for the Fleet.
+    Every function broadcasts over leading dimensions, so positions of shape
+    (n_sats, n_times, 3) against a sun track of shape (n_times, 3) are handled
+    in one pass. Illumination is the visible fraction of the solar disk:
+    1.0 = full sun, 0.0 = umbra, in between = penumbra (or annular).
+    """
+    @staticmethod
+    def sun_position_eci(jd):
+        """
+        Low-precision solar ephemeris (Astronomical Almanac, ~0.01 deg).
+        jd: Julian Date(s). Returns sun position in ECI (km), shape (..., 3).
+        """
+        T = (np.asarray(jd, dtype=np.float64) - J2000) / 36525.0
+        mean_lon = np.radians(280.460 + 36000.771 * T)
+        M = np.radians(357.5291092 + 35999.05034 * T)
+
+        ecl_lon = mean_lon + np.radians(1.914666471 * np.sin(M) + 0.019994643 * np.sin(2 * M))
+        r_au = 1.000140612 - 0.016708617 * np.cos(M) - 0.000139589 * np.cos(2 * M)
+        obliquity = np.radians(23.439291 - 0.0130042 * T)
+
+        r = r_au * AU
+        return np.stack([
+            r * np.cos(ecl_lon),
+            r * np.cos(obliquity) * np.sin(ecl_lon),
+            r * np.sin(obliquity) * np.sin(ecl_lon),
+        ], axis=-1)
+
+    @staticmethod
+    def illumination_cylindrical(r_sat, r_sun):
+        """
+        Cylindrical shadow model: umbra is the Earth-radius cylinder behind the
+        Earth along the sun line. Returns 0.0 (shadow) or 1.0 (sunlit).
+        """
+        r_sat = np.asarray(r_sat, dtype=np.float64)
+        sun_hat = r_sun / np.linalg.norm(r_sun, axis=-1, keepdims=True)
+
+        along = np.sum(r_sat * sun_hat, axis=-1)
+        perp = np.linalg.norm(r_sat - along[..., None] * sun_hat, axis=-1)
+        return np.where((along < 0) & (perp < R_EARTH), 0.0, 1.0)
+
+    @staticmethod
+    def _disk_geometry(r_sat, r_sun):
+        """
+        Apparent radii of the Sun (a) and Earth (b) seen from the spacecraft,
+        and the angular separation of their centres (c), all in radians.
+        """
+        r_sat = np.asarray(r_sat, dtype=np.float64)
+        to_sun = r_sun - r_sat
+        d_sun = np.linalg.norm(to_sun, axis=-1)
+        d_earth = np.linalg.norm(r_sat, axis=-1)
+
+        a = np.arcsin(np.clip(R_SUN / d_sun, -1.0, 1.0))
+        b = np.arcsin(np.clip(R_EARTH / d_earth, -1.0, 1.0))
+        cos_c = np.sum(-r_sat * to_sun, axis=-1) / (d_earth * d_sun)
+        c = np.arccos(np.clip(cos_c, -1.0, 1.0))
+        return a, b, c
+
+    @staticmethod
+    def illumination_conical(r_sat, r_sun):
+        """
+        Conical (umbra + penumbra) model from the apparent solar and Earth disks
+        as seen by the spacecraft (Montenbruck & Gill, Sec. 3.4.2).
+        Returns the visible fraction of the solar disk in [0, 1].
+        """
+        a, b, c = EclipseEngine._disk_geometry(r_sat, r_sun)
+
+        # Partial overlap of the two disks
+        with np.errstate(invalid='ignore', divide='ignore'):
+            x = (c**2 + a**2 - b**2) / (2 * c)
+            y = np.sqrt(np.maximum(a**2 - x**2, 0.0))
+            area = (a**2 * np.arccos(np.clip(x / a, -1.0, 1.0))
+                    + b**2 * np.arccos(np.clip((c - x) / b, -1.0, 1.0))
+                    - c * y)
+            partial = 1.0 - area / (np.pi * a**2)
+
+        illum = np.where(c >= a + b, 1.0,                       # No overlap: full sun
+                np.where(c <= b - a, 0.0,                        # Sun fully behind Earth: umbra
+                np.where(c <= a - b, 1.0 - b**2 / a**2,          # Earth inside solar disk: annular
+                         partial)))                              # Penumbra
+        return np.clip(illum, 0.0, 1.0)
+
+    @staticmethod
+    def illumination(r_sat, r_sun, model="conical"):
+        if model == "conical":
+            return EclipseEngine.illumination_conical(r_sat, r_sun)
+        if model == "cylindrical":
+            return EclipseEngine.illumination_cylindrical(r_sat, r_sun)
+        raise ValueError(f"Unknown shadow model '{model}' (expected 'conical' or 'cylindrical')")
+
+    @staticmethod
+    def shadow_fractions(illum):
+        """
+        Fraction of time steps spent in umbra and penumbra, per satellite (last axis = time).
+        """
+        umbra = np.mean(illum <= 0.0, axis=-1)
+        penumbra = np.mean((illum > 0.0) & (illum < 1.0), axis=-1)
+        return umbra, penumbra
+
+    @staticmethod
+    def shadow_margin(r_sat, r_sun, model="conical", region="penumbra"):
+        """
+        Signed, unclipped distance to the shadow boundary: positive outside,
+        negative inside, smooth across the crossing (unlike illumination, which
+        saturates at 0 and 1). Conical: c - (a + b) for the penumbra edge or
+        c - (b - a) for the umbra edge (radians). Cylindrical: distance from the
+        shadow cylinder (km).
+        """
+        if model == "conical":
+            a, b, c = EclipseEngine._disk_geometry(r_sat, r_sun)
+            if region == "penumbra":
+                return c - (a + b)
+            if region == "umbra":
+                return c - (b - a)
+            raise ValueError(f"Unknown shadow region '{region}' (expected 'penumbra' or 'umbra')")
+        if model == "cylindrical":
+            r_sat = np.asarray(r_sat, dtype=np.float64)
+            sun_hat = r_sun / np.linalg.norm(r_sun, axis=-1, keepdims=True)
+            along = np.sum(r_sat * sun_hat, axis=-1)
+            perp = np.linalg.norm(r_sat - along[..., None] * sun_hat, axis=-1)
+            # Sun-side points are never shadowed; keep them positive
+            return np.where(along < 0, perp - R_EARTH, perp)
+        raise ValueError(f"Unknown shadow model '{model}' (expected 'conical' or 'cylindrical')")
+
+    @staticmethod
+    def eclipse_events(times, margin):
+        """
+        Eclipse entry/exit times for each satellite row of a shadow_margin array
+        (n_sats, n_times). Zero crossings of the margin are linearly interpolated
+        between samples. Returns one (n_events, 2) array of [entry, exit] per
+        satellite; NaN marks an eclipse already in progress at the start or still
+        in progress at the end of the grid.
+        """
+        times = np.asarray(times, dtype=np.float64)
+        margin = np.atleast_2d(margin)
+        shadow = margin < 0
+
+        events = []
+        for row, in_shadow in zip(margin, shadow):
+            flips = np.flatnonzero(np.diff(in_shadow.astype(np.int8)))
+            # Interpolate the zero crossing within each flipping interval
+            i0, i1 = flips, flips + 1
+            frac = row[i0] / (row[i0] - row[i1])
+            crossings = times[i0] + np.clip(frac, 0.0, 1.0) * (times[i1] - times[i0])
+
+            entries = list(crossings[in_shadow[i1]])
+            exits = list(crossings[~in_shadow[i1]])
+            if in_shadow[0]:
+                entries.insert(0, np.nan)
+            if in_shadow[-1]:
+                exits.append(np.nan)
+            events.append(np.column_stack([entries, exits]) if entries else np.empty((0, 2)))
+        return events
+
+    @staticmethod
+    def circular_orbit_positions(altitude_km, inclination_deg, raan_deg, times_s, phase_deg=0.0):
+        """
+        ECI positions (km) of circular orbits over a time grid (s).
+        Orbit parameters may be arrays (one per satellite) -> shape (n_sats, n_times, 3).
+        """
+        alt = np.atleast_1d(np.asarray(altitude_km, dtype=np.float64))[:, None]
+        inc = np.radians(np.atleast_1d(inclination_deg))[:, None]
+        raan = np.radians(np.atleast_1d(raan_deg))[:, None]
+        phase0 = np.radians(np.atleast_1d(phase_deg))[:, None]
+
+        r = R_EARTH + alt
+        u = phase0 + np.sqrt(MU / r**3) * np.asarray(times_s, dtype=np.float64)[None, :]
+
+        x_orb, y_orb = r * np.cos(u), r * np.sin(u)
+        return np.stack([
+            x_orb * np.cos(raan) - y_orb * np.cos(inc) * np.sin(raan),
+            x_orb * np.sin(raan) + y_orb * np.cos(inc) * np.cos(raan),
+            y_orb * np.sin(inc),
+        ], axis=-1)
+
+    @staticmethod
+    def fleet_positions(satellites, t):
+        """
+        ECI (GCRS) positions (km) of skyfield EarthSatellites over a skyfield Time
+        array -> shape (n_sats, n_times, 3).
+        """
+        return np.stack([sat.at(t).position.km.T for sat in satellites])
+
+    @staticmethod
+    def fleet_illumination(satellites, t, model="conical"):
+        """
+        Illumination fraction (n_sats, n_times) for catalog satellites over time t.
+        """
+        r_sun = EclipseEngine.sun_position_eci(t.ut1)
+        return EclipseEngine.illumination(EclipseEngine.fleet_positions(satellites, t), r_sun, model)
@@ -6,10 +6,31 @@ class EntropyEngine:
     Simulates Hardware Degradation, Radiation Effects, and Sensor Noise.
     'Honest Enough' Reality: Hardware is never perfect.
     """
-    def __init__(self):
+    __slots__ = ("dtype", "imu_bias", "pos_noise_std", "vel_noise_std", "bias_jitter",
+                 "radiation_counter", "rng")
+
+    def __init__(self, rng=None, dtype=np.float64, pos_noise_std=0.05, vel_noise_std=0.01, bias_jitter=0.1):
+        self.dtype = np.dtype(dtype)
         self.imu_bias = np.array([0.001, -0.002, 0.0005]) # Fixed gyro drift
+        self.pos_noise_std = pos_noise_std # m
+        self.vel_noise_std = vel_noise_std # m/s
+        self.bias_jitter = bias_jitter     # +/- 10% drift wander
         self.radiation_counter = 0
         
+        # Seeded Generator for reproducible trials (falls back to global NumPy RNG)
+        self.rng = rng if rng is not None else np.random
+        
+    def get_config(self):
+        """
+        Noise model parameters (used to fingerprint Monte Carlo results).
+        """
+        return {
+            "imu_bias": self.imu_bias.tolist(),
+            "pos_noise_std": self.pos_noise_std,
+            "vel_noise_std": self.vel_noise_std,
+            "bias_jitter": self.bias_jitter,
+        }
+        
     def inject_noise(self, true_state):
         """
         Corrupts the perfect 'Ground Truth' state with real-world sensor errors.
@@ -18,14 +39,14 @@ class EntropyEngine:
         vel = true_state[3:]
         
         # 1. White Noise (Thermal noise in electronics)
-        pos_noise = np.random.normal(0, 0.05, 3) # +/- 5cm jitter
-        vel_noise = np.random.normal(0, 0.01, 3) # +/- 1cm/s jitter
+        pos_noise = self.rng.normal(0, self.pos_noise_std, 3) # +/- 5cm jitter
+        vel_noise = self.rng.normal(0, self.vel_noise_std, 3) # +/- 1cm/s jitter
         
         # 2. Random Walk / Bias (IMU Drift)
         # In reality, this grows over time until a Star Tracker resets it.
-        vel_bias = self.imu_bias * np.random.uniform(0.9, 1.1)
+        vel_bias = self.imu_bias * self.rng.uniform(1 - self.bias_jitter, 1 + self.bias_jitter)
         
-        noisy_state = np.zeros(6)
+        noisy_state = np.zeros(6, dtype=self.dtype)
         noisy_state[:3] = pos + pos_noise
         noisy_state[3:] = vel + vel_noise + vel_bias
         
@@ -1,8 +1,9 @@
 import random
 import numpy as np
 from deap import base, creator, tools
-from mission_engine import OrbitalMechanics, MU, R_EARTH
+from mission_engine import OrbitalMechanics
 from data_processor import TLEProcessor  # <--- NEW CONNECTION
+from catalog_index import CatalogIndex
 
 # --- SAFE GLOBAL INITIALIZATION ---
 if not hasattr(creator, "FitnessMin"):
@@ -47,21 +48,9 @@ class MissionOptimizer:
         proc = TLEProcessor()
         catalog = proc.load_catalog()
         
-        altitudes = []
-        for name, sat in catalog.items():
-            try:
-                # Skyfield no_kozai is in radians/minute. Convert to radians/second.
-                n_rad_min = sat.model.no_kozai
-                n_rad_sec = n_rad_min / 60.0
-                
-                # Calculate Semi-Major Axis (km) -> Altitude
-                if n_rad_sec > 0:
-                    a = (MU / (n_rad_sec ** 2)) ** (1/3)
-                    alt = a - R_EARTH
-                    if 100 < alt < 10000: # Filter relevant LEO/MEO
-                        altitudes.append(alt)
-            except Exception:
-                pass
+        # Altitudes come straight from the index's element arrays (no per-object scan)
+        index = CatalogIndex(catalog)
+        altitudes = index.columns["altitude_km"][index.range("altitude_km", 100, 10000)] # Filter relevant LEO/MEO
         
         # Create Histogram (Bin size: 10km)
         # This gives us a lookup table: "How many satellites are in this 10km slice?"
@@ -0,0 +1,130 @@
+import itertools
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+import numpy as np
+from system_analytics import SystemValidator, REQ_THRESHOLD
+
+logger = logging.getLogger("Gain_Sweep")
+
+# Which constructor each sweepable parameter is routed to
+PILOT_PARAMS = ("settling_time", "damping", "Ki", "deadband")
+NOISE_PARAMS = ("pos_noise_std", "vel_noise_std", "bias_jitter")
+
+METRICS = ("mean", "std_dev", "3_sigma_low", "margin", "mean_delta_v", "passed")
+
+# --- WORKER-SIDE HANDLE ON THE SHARED RESULT ARRAY ---
+_shm = None
+_results = None
+
+def _attach(shm_name, shape):
+    global _shm, _results
+    _shm = shared_memory.SharedMemory(name=shm_name)
+    _results = np.ndarray(shape, dtype=np.float64, buffer=_shm.buf)
+
+def _evaluate_point(row, names, values, trials, seed):
+    """
+    Runs the Monte Carlo suite for one parameter point and writes its metrics
+    straight into row 'row' of the shared array (only the row index is pickled back).
+    """
+    params = dict(zip(names, values))
+    pilot_params = {k: v for k, v in params.items() if k in PILOT_PARAMS}
+    noise_params = {k: v for k, v in params.items() if k in NOISE_PARAMS}
+
+    stats = SystemValidator.run_monte_carlo(trials, seed=seed, pilot_params=pilot_params,
+                                            noise_params=noise_params)
+    stats["passed"] = float(stats["3_sigma_low"] >= REQ_THRESHOLD)
+    _results[row] = [stats[m] for m in METRICS]
+    return row
+
+class GainSweep:
+    """
+    GNC Gain-Dispersion Sweep.
+    Maps the certification envelope over controller and noise parameters by
+    running the Monte Carlo suite at every point of a grid or Latin-hypercube
+    design across a process pool.
+    """
+    def __init__(self, trials=50, seed=0, workers=None):
+        self.trials = trials
+        self.seed = seed # Common random numbers: every point sees the same noise draws
+        self.workers = workers
+
+    @staticmethod
+    def grid(axes):
+        """
+        Full-factorial design. axes: {param: [values...]}. Returns (names, points).
+        """
+        names = tuple(axes)
+        points = np.array(list(itertools.product(*(axes[n] for n in names))), dtype=np.float64)
+        return names, points
+
+    @staticmethod
+    def latin_hypercube(bounds, n_samples, seed=None):
+        """
+        Latin-hypercube design. bounds: {param: (lo, hi)}. Returns (names, points).
+        """
+        rng = np.random.default_rng(seed)
+        names = tuple(bounds)
+        points = np.empty((n_samples, len(names)))
+        for j, name in enumerate(names):
+            lo, hi = bounds[name]
+            # One sample per stratum, strata shuffled independently per dimension
+            u = (rng.permutation(n_samples) + rng.random(n_samples)) / n_samples
+            points[:, j] = lo + u * (hi - lo)
+        return names, points
+
+    def run(self, names, points):
+        """
+        Evaluates every point. Returns {"names", "points", "metrics": {metric: ndarray}}.
+        """
+        unknown = set(names) - set(PILOT_PARAMS) - set(NOISE_PARAMS)
+        if unknown:
+            raise ValueError(f"Unsweepable parameters: {sorted(unknown)} "
+                             f"(expected from {PILOT_PARAMS + NOISE_PARAMS})")
+
+        shape = (len(points), len(METRICS))
+        shm = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape))) * 8)
+        try:
+            results = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+            results[:] = np.nan
+
+            with ProcessPoolExecutor(self.workers, initializer=_attach, initargs=(shm.name, shape)) as pool:
+                futures = [pool.submit(_evaluate_point, i, names, tuple(p), self.trials, self.seed)
+                           for i, p in enumerate(points)]
+                for n_done, future in enumerate(as_completed(futures), 1):
+                    future.result()
+                    if n_done % 10 == 0 or n_done == len(futures):
+                        logger.info(f"Sweep: {n_done}/{len(futures)} points evaluated")
+
+            metrics = results.copy()
+        finally:
+            shm.close()
+            shm.unlink()
+
+        return {
+            "names": names,
+            "points": points,
+            "metrics": {m: metrics[:, j] for j, m in enumerate(METRICS)},
+        }
+
+    @staticmethod
+    def response_surface(result, x, y, metric="3_sigma_low"):
+        """
+        2-D response surface of 'metric' over parameters x and y, averaging over
+        any other swept dimensions. Returns (x_values, y_values, Z[len(y), len(x)]).
+        For Latin-hypercube results the points are binned onto their unique values,
+        so pass grid results (or interpolate) for smooth surfaces.
+        """
+        names = list(result["names"])
+        px = result["points"][:, names.index(x)]
+        py = result["points"][:, names.index(y)]
+        values = result["metrics"][metric]
+
+        xs, ix = np.unique(px, return_inverse=True)
+        ys, iy = np.unique(py, return_inverse=True)
+        total = np.zeros((len(ys), len(xs)))
+        count = np.zeros((len(ys), len(xs)))
+        np.add.at(total, (iy, ix), values)
+        np.add.at(count, (iy, ix), 1)
+        with np.errstate(invalid='ignore'):
+            return xs, ys, total / count
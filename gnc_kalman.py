@@ -3,35 +3,42 @@ import numpy as np
 class ExtendedKalmanFilter:
     """
     Estimates true state [x, y, z, vx, vy, vz] from noisy measurements.
+    State and covariance are updated in place, so they may be views into
+    shared campaign buffers (see campaign_buffers.py).
     """
-    def __init__(self, initial_state, dt):
-        self.state = initial_state.copy()
+    __slots__ = ("dtype", "state", "dt", "F", "P", "Q", "H", "R", "I")
+
+    def __init__(self, initial_state, dt, dtype=None):
+        self.dtype = np.dtype(dtype if dtype is not None else initial_state.dtype)
+        self.state = initial_state.astype(self.dtype)
         self.dt = dt
         
         # State Transition Matrix (Newtonian Physics)
-        self.F = np.eye(6)
+        self.F = np.eye(6, dtype=self.dtype)
         self.F[:3, 3:] = np.eye(3) * self.dt
         
         # Covariance Matrix (Initial Uncertainty)
-        self.P = np.eye(6) * 0.1 
+        self.P = np.eye(6, dtype=self.dtype) * 0.1
         
         # Process Noise (Physics isn't perfect)
-        self.Q = np.eye(6) * 0.001
+        self.Q = np.eye(6, dtype=self.dtype) * 0.001
         
         # Measurement Matrix (We measure all 6 states)
-        self.H = np.eye(6)
+        self.H = np.eye(6, dtype=self.dtype)
         
         # Measurement Noise (Sensor Specs)
-        self.R = np.eye(6) * 0.1
+        self.R = np.eye(6, dtype=self.dtype) * 0.1
+        
+        self.I = np.eye(6, dtype=self.dtype)
 
     def predict(self, accel_command):
         # 1. Extrapolate State: x = Fx + Bu
-        self.state = self.F @ self.state
+        self.state[:] = self.F @ self.state
         self.state[3:] += accel_command * self.dt
         self.state[:3] += accel_command * 0.5 * self.dt**2
         
         # 2. Extrapolate Uncertainty: P = FPF' + Q
-        self.P = self.F @ self.P @ self.F.T + self.Q
+        self.P[:] = self.F @ self.P @ self.F.T + self.Q
 
     def update(self, measurement):
         # 1. Calculate Kalman Gain: K = PH' (HPH' + R)^-1
@@ -40,10 +47,9 @@ class ExtendedKalmanFilter:
         
         # 2. Update State Estimate: x = x + K(y - Hx)
         y = measurement - (self.H @ self.state)
-        self.state = self.state + (K @ y)
+        self.state += K @ y
         
         # 3. Update Uncertainty: P = (I - KH)P
-        I = np.eye(6)
-        self.P = (I - K @ self.H) @ self.P
+        self.P[:] = (self.I - K @ self.H) @ self.P
         
         return self.state
\ No newline at end of file
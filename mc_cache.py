@@ -0,0 +1,63 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import numpy as np
+
+logger = logging.getLogger("MC_Cache")
+
+class MonteCarloCache:
+    """
+    Content-Addressed Store for Monte Carlo Trial Results.
+    Each entry holds per-trial arrays in trial order, so a larger run
+    only has to compute the trials beyond what is already on disk.
+    """
+    def __init__(self, cache_dir='.mc_cache'):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def make_key(pilot_config, noise_config, seed, extra=None):
+        """
+        SHA-256 fingerprint of everything that determines the trial outcomes.
+        """
+        payload = {
+            "pilot": pilot_config,
+            "noise": noise_config,
+            "seed": seed,
+            "extra": extra or {},
+        }
+        blob = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def load(self, key):
+        """
+        Returns {field: ndarray} for a cached entry, or None on a miss.
+        """
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                return {name: data[name] for name in data.files}
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+            return None
+
+    def save(self, key, results):
+        """
+        Atomically writes the per-trial arrays (temp file + rename).
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Unique temp name: concurrent Streamlit sessions share one process
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **{name: np.asarray(values) for name, values in results.items()})
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -4,16 +4,24 @@ from gnc_kalman import ExtendedKalmanFilter
 class AdvancedRLPilot:
     """
     Guidance, Navigation, and Control (GNC) System.
+    dtype selects the working precision (np.float32 for compact campaigns);
+    the keyword arguments override the baseline controller tuning.
     """
-    def __init__(self):
+    __slots__ = ("dtype", "mass", "max_thrust", "dt", "state", "target", "estimator",
+                 "estimated_state", "total_delta_v", "settling_time", "damping",
+                 "Kp", "Kd", "Ki", "integral_error", "deadband")
+
+    def __init__(self, dtype=np.float64, settling_time=70.0, damping=0.9, Ki=0.5, deadband=0.01):
+        self.dtype = np.dtype(dtype)
+        
         # --- SPACECRAFT BUS PROPERTIES ---
         self.mass = 500.0      # kg
         self.max_thrust = 50.0 # N 
         self.dt = 0.1          # 10Hz
         
         # --- INITIAL STATE ---
-        self.state = np.array([200.0, 50.0, -25.0, 0.0, 0.0, 0.0])
-        self.target = np.array([0.0, 0.0, 0.0])
+        self.state = np.array([200.0, 50.0, -25.0, 0.0, 0.0, 0.0], dtype=self.dtype)
+        self.target = np.array([0.0, 0.0, 0.0], dtype=self.dtype)
         
         # --- NAVIGATION SYSTEM (EKF) ---
         self.estimator = ExtendedKalmanFilter(self.state, self.dt)
@@ -23,18 +31,40 @@ class AdvancedRLPilot:
         self.total_delta_v = 0.0
         
         # --- CONTROL LAWS (PID) ---
-        self.settling_time = 70.0  
-        self.damping = 0.9         
+        self.settling_time = settling_time
+        self.damping = damping
         wn = 4.0 / (self.damping * self.settling_time)
         
         # Gains
         self.Kp = (wn ** 2) * self.mass
         self.Kd = 2 * self.damping * wn * self.mass
-        self.Ki = 0.5  # Integral Gain
+        self.Ki = Ki  # Integral Gain
         
         # Internal Logic
-        self.integral_error = np.zeros(3)
-        self.deadband = 0.01
+        self.integral_error = np.zeros(3, dtype=self.dtype)
+        self.deadband = deadband
+
+    def get_config(self):
+        """
+        Bus, guidance and estimator parameters (used to fingerprint Monte Carlo results).
+        """
+        return {
+            "dtype": self.dtype.name,
+            "mass": self.mass,
+            "max_thrust": self.max_thrust,
+            "dt": self.dt,
+            "initial_state": self.state.tolist(),
+            "target": self.target.tolist(),
+            "settling_time": self.settling_time,
+            "damping": self.damping,
+            "Kp": self.Kp,
+            "Kd": self.Kd,
+            "Ki": self.Ki,
+            "deadband": self.deadband,
+            "ekf_P0": np.diag(self.estimator.P).tolist(),
+            "ekf_Q": np.diag(self.estimator.Q).tolist(),
+            "ekf_R": np.diag(self.estimator.R).tolist(),
+        }
 
     def get_control_effort(self, measurement):
         """
@@ -42,7 +72,7 @@ class AdvancedRLPilot:
         Input: measurement (Noisy [x,y,z,vx,vy,vz])
         """
         # 1. Update Estimator
-        self.estimated_state = self.estimator.update(measurement)
+        self.estimated_state[:] = self.estimator.update(measurement)
         
         # 2. Extract Logic Variables
         est_pos = self.estimated_state[:3]
@@ -51,7 +81,7 @@ class AdvancedRLPilot:
         
         # 3. PID Control Law
         self.integral_error += error * self.dt
-        self.integral_error = np.clip(self.integral_error, -10, 10) # Anti-windup
+        np.clip(self.integral_error, -10, 10, out=self.integral_error) # Anti-windup
         
         force = (self.Kp * error) + (self.Ki * self.integral_error) - (self.Kd * est_vel)
         
@@ -63,7 +93,7 @@ class AdvancedRLPilot:
             
         # 5. Deadband
         if np.linalg.norm(error) < self.deadband and np.linalg.norm(est_vel) < 0.01:
-            return np.zeros(3)
+            return np.zeros(3, dtype=self.dtype)
         
         # 6. Predict next state for Kalman Filter
         accel_command = force / self.mass
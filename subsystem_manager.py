@@ -22,33 +22,80 @@ class PowerThermalSubsystem:
         # --- THERMAL STATE ---
         self.temperature = 20.0      # Celsius
     
-    def update(self, dt, is_eclipse, is_thrusting):
+    def _step(self, dt, charge, temperature, illumination, is_thrusting):
+        """
+        One power/thermal step. Works on scalars or on arrays (one entry per bus).
+        Eclipse (heaters on, cooling) means umbra: illumination <= 0.
+        Returns (charge Wh, temperature C, power draw W).
+        """
+        is_eclipse = illumination <= 0.0
+        
         # 1. Calculate Generation (Input)
-        generation = 0.0
-        if not is_eclipse:
-            generation = SOLAR_CONSTANT * self.solar_area * self.solar_efficiency
+        generation = SOLAR_CONSTANT * self.solar_area * self.solar_efficiency * illumination
             
         # 2. Calculate Consumption (Output)
-        consumption = self.base_load
+        consumption = (self.base_load
+                       + self.thruster_load * is_thrusting
+                       + self.heater_load * is_eclipse)
         
-        if is_thrusting:
-            consumption += self.thruster_load
-            
-        if is_eclipse:
-            consumption += self.heater_load
-            self.temperature -= (0.5 * dt) # Cool down
-        else:
-            self.temperature += (0.2 * dt) # Heat up
+        # Cool down in eclipse, heat up in sunlight
+        temperature = temperature + np.where(is_eclipse, -0.5 * dt, 0.2 * dt)
             
         # 3. Update Battery
         net_power = generation - consumption # Watts
         energy_step = net_power * (dt / 3600.0) # Watt-hours
+        charge = np.clip(charge + energy_step, 0.0, self.battery_capacity)
+        
+        return charge, temperature, consumption
+    
+    def update(self, dt, is_eclipse=None, is_thrusting=False, illumination=None):
+        """
+        illumination: visible solar-disk fraction from EclipseEngine (0..1).
+        When given it scales generation through penumbra and decides eclipse
+        (umbra) itself; otherwise is_eclipse switches the arrays fully on/off.
+        Passing both is allowed only when they agree.
+        """
+        if illumination is None:
+            illumination = 0.0 if is_eclipse else 1.0
+        elif is_eclipse is not None and bool(is_eclipse) != (illumination <= 0.0):
+            raise ValueError(f"is_eclipse={is_eclipse} contradicts illumination={illumination} "
+                             f"(eclipse means illumination <= 0)")
         
-        self.current_charge += energy_step
-        self.current_charge = max(0.0, min(self.current_charge, self.battery_capacity))
+        charge, temperature, consumption = self._step(
+            dt, self.current_charge, self.temperature, illumination, bool(is_thrusting)
+        )
+        self.current_charge = float(charge)
+        self.temperature = float(temperature)
             
         return {
             "charge_pct": (self.current_charge / self.battery_capacity) * 100,
             "temp_c": self.temperature,
-            "power_draw": consumption
-        }
\ No newline at end of file
+            "power_draw": float(consumption)
+        }
+
+    def simulate_fleet(self, illumination, dt, thrusting=None):
+        """
+        Vectorized power/thermal budget for a fleet of identical buses.
+        illumination: (n_sats, n_times) from EclipseEngine; a step counts as
+        eclipse (heaters on, cooling) when the satellite is in umbra.
+        Returns charge (%), temperature (C) and power draw (W), each (n_sats, n_times).
+        """
+        illumination = np.atleast_2d(illumination)
+        n_sats, n_times = illumination.shape
+        if thrusting is None:
+            thrusting = np.zeros_like(illumination, dtype=bool)
+        
+        charge = np.full(n_sats, self.current_charge)
+        temperature = np.full(n_sats, self.temperature)
+        out = {name: np.zeros((n_sats, n_times)) for name in ("charge_pct", "temp_c", "power_draw")}
+        
+        # Battery clamping is sequential in time, but every step is vectorized across the fleet
+        for k in range(n_times):
+            charge, temperature, consumption = self._step(
+                dt, charge, temperature, illumination[:, k], thrusting[:, k]
+            )
+            out["charge_pct"][:, k] = (charge / self.battery_capacity) * 100
+            out["temp_c"][:, k] = temperature
+            out["power_draw"][:, k] = consumption
+        
+        return out
\ No newline at end of file
@@ -1,54 +1,255 @@
 import numpy as np
+from statistics import NormalDist
 from rl_pilot import AdvancedRLPilot
 from entropy_engine import EntropyEngine
+from mc_cache import MonteCarloCache
+from campaign_buffers import CampaignBuffers
+
+REQ_THRESHOLD = 98.0 # % accuracy required at 3-sigma
+MAX_STEPS = 2500     # Physics steps per trial
+DOCK_RADIUS = 0.05   # m
 
 class SystemValidator:
     """
     Independent Verification & Validation (IV&V) Module.
     """
     @staticmethod
-    def run_monte_carlo(iterations=50):
+    def _physics_step(pilot, thrust):
+        # Semi-implicit Euler on the relative state, charging the burn to the fuel tally
+        accel = thrust / pilot.mass
+        pilot.state[3:] += accel * pilot.dt
+        pilot.state[:3] += pilot.state[3:] * pilot.dt
+        pilot.total_delta_v += (np.linalg.norm(thrust) / pilot.mass) * pilot.dt
+
+    @staticmethod
+    def run_docking_scenario(steps=1500, thrust_gain=0.8, tolerance=0.02, rng=None, on_progress=None):
+        """
+        Proximity Operations Docking Scenario (shared by the dashboard and batch runner).
+        Returns the trajectory history plus dock/fuel outcome.
+        """
+        pilot = AdvancedRLPilot()
+        murphy = EntropyEngine(rng)
+        history = []
+        docked_at = None
+        dist = np.linalg.norm(pilot.state[:3])
+
+        for i in range(steps):
+            history.append(pilot.state.copy())
+
+            # REALISM: Add Sensor Noise
+            input_state = murphy.inject_noise(pilot.state)
+
+            # CONTROL: Smooth the thrust (Simple Gain Dampening)
+            thrust = pilot.get_control_effort(input_state) * thrust_gain # Dampen to prevent zigzag
+
+            # PHYSICS
+            SystemValidator._physics_step(pilot, thrust)
+            dist = np.linalg.norm(pilot.state[:3])
+
+            # REALISM: Docking Tolerance
+            if dist < tolerance:
+                docked_at = i * pilot.dt
+                break
+
+            if on_progress is not None and i % 100 == 0:
+                on_progress(i, steps)
+
+        return {
+            "docked": docked_at is not None,
+            "dock_time_s": docked_at,
+            "delta_v": pilot.total_delta_v,
+            "final_range": dist,
+            "history": history
+        }
+
+    @staticmethod
+    def _run_trial(rng, precision=np.float64, buffers=None, slot=None, pilot_params=None, noise_params=None):
+        """
+        Flies one stochastic docking approach. Returns (accuracy %, delta-v m/s).
+        With buffers, the trial's state/covariance/history live in row 'slot'.
+        pilot_params / noise_params override the AdvancedRLPilot / EntropyEngine defaults.
+        """
+        pilot = AdvancedRLPilot(precision, **(pilot_params or {}))
+        murphy = EntropyEngine(rng, precision, **(noise_params or {}))
+        if buffers is not None:
+            buffers.bind(slot, pilot)
+        initial_dist = np.linalg.norm(pilot.state[:3])
+
+        # --- PHYSICS LOOP ---
+        for step in range(MAX_STEPS):
+            if buffers is not None:
+                buffers.record(slot, step)
+
+            # 1. Inject Noise
+            noisy_state = murphy.inject_noise(pilot.state)
+
+            # 2. Pilot Calculation (Pass full state vector)
+            thrust = pilot.get_control_effort(noisy_state)
+
+            # 3. Physics Updates
+            SystemValidator._physics_step(pilot, thrust)
+
+            if np.linalg.norm(pilot.state[:3]) < DOCK_RADIUS: break
+
+        # --- SCORING ---
+        final_dist = np.linalg.norm(pilot.state[:3] - pilot.target)
+        acc = max(0.0, float(1 - (final_dist / initial_dist)) * 100)
+        return acc, float(pilot.total_delta_v)
+
+    @staticmethod
+    def _trial_rng(seed, index):
+        # Independent stream per trial so any trial can be reproduced (and cached) alone
+        if seed is None:
+            return np.random.default_rng()
+        return np.random.default_rng([seed, index])
+
+    @staticmethod
+    def cache_key(seed, precision=np.float64, pilot_params=None, noise_params=None):
+        """
+        Fingerprint of the pilot, noise model, precision and seed that produced a trial set.
+        """
+        extra = {"max_steps": MAX_STEPS, "dock_radius": DOCK_RADIUS}
+        return MonteCarloCache.make_key(
+            AdvancedRLPilot(precision, **(pilot_params or {})).get_config(),
+            EntropyEngine(**(noise_params or {})).get_config(), seed, extra
+        )
+
+    @staticmethod
+    def collect_trials(iterations, seed=None, cache=None, previous=None, precision=np.float64,
+                       pilot_params=None, noise_params=None):
+        """
+        Returns {"accuracy": ndarray, "fuel": ndarray} for trials 0..iterations-1.
+        With a seed and a cache, stored trials are reused and only new ones are flown.
+        'previous' carries trials already flown in this session with the same seed.
+        """
+        use_cache = cache is not None and seed is not None
+        key = SystemValidator.cache_key(seed, precision, pilot_params, noise_params) if use_cache else None
+
         results = {"accuracy": [], "fuel": []}
-        REQ_THRESHOLD = 98.0 
-        murphy = EntropyEngine()
-        
-        for i in range(iterations):
-            pilot = AdvancedRLPilot()
-            initial_dist = np.linalg.norm(pilot.state[:3])
-            
-            # --- PHYSICS LOOP ---
-            for _ in range(2500): 
-                # 1. Inject Noise
-                noisy_state = murphy.inject_noise(pilot.state)
-                
-                # 2. Pilot Calculation (Pass full state vector)
-                thrust = pilot.get_control_effort(noisy_state)
-                
-                # 3. Physics Updates
-                accel = thrust / pilot.mass
-                pilot.state[3:] += accel * pilot.dt
-                pilot.state[:3] += pilot.state[3:] * pilot.dt
-                
-                pilot.total_delta_v += (np.linalg.norm(thrust) / pilot.mass) * pilot.dt
-                
-                if np.linalg.norm(pilot.state[:3]) < 0.05: break
-            
-            # --- SCORING ---
-            final_dist = np.linalg.norm(pilot.state[:3] - pilot.target)
-            acc = max(0, (1 - (final_dist / initial_dist)) * 100)
+        if use_cache:
+            cached = cache.load(key)
+            if cached is not None:
+                results = {name: list(cached[name]) for name in results}
+        if previous is not None and len(previous["accuracy"]) > len(results["accuracy"]):
+            results = {name: list(previous[name]) for name in results}
+
+        start = len(results["accuracy"])
+        for i in range(start, iterations):
+            rng = SystemValidator._trial_rng(seed, i)
+            acc, fuel = SystemValidator._run_trial(rng, precision, pilot_params=pilot_params, noise_params=noise_params)
             results["accuracy"].append(acc)
-            results["fuel"].append(pilot.total_delta_v)
-            
+            results["fuel"].append(fuel)
+
+        if use_cache and iterations > start:
+            cache.save(key, results)
+
+        return {name: np.array(values[:iterations]) for name, values in results.items()}
+
+    @staticmethod
+    def _summarize(trials):
         # --- STATS ---
-        data = np.array(results["accuracy"])
+        data = trials["accuracy"]
         mu = np.mean(data)
         sigma = np.std(data)
         worst_case = mu - (3 * sigma)
-        
+
         return {
             "mean": mu,
             "std_dev": sigma,
             "3_sigma_low": worst_case,
             "margin": worst_case - REQ_THRESHOLD,
-            "raw_data": results["accuracy"]
-        }
\ No newline at end of file
+            "mean_delta_v": np.mean(trials["fuel"]),
+            "raw_data": data.tolist()
+        }
+
+    @staticmethod
+    def run_monte_carlo(iterations=50, seed=None, cache=None, precision=np.float64,
+                        pilot_params=None, noise_params=None):
+        trials = SystemValidator.collect_trials(iterations, seed, cache, precision=precision,
+                                                pilot_params=pilot_params, noise_params=noise_params)
+        return SystemValidator._summarize(trials)
+
+    @staticmethod
+    def run_adaptive(max_iterations=5000, batch_size=25, min_iterations=20,
+                     confidence=0.99, seed=None, cache=None, precision=np.float64):
+        """
+        Sequential certification: flies trials in batches and stops as soon as the
+        confidence interval on the 3-sigma bound lies entirely above or below
+        REQ_THRESHOLD, or the max_iterations budget is spent.
+        The error rate (1 - confidence) is Bonferroni-split across every planned
+        look, so repeated checking does not inflate it. The interval itself is a
+        normal approximation; accuracy is clipped and skewed near its ceiling, so
+        treat 'confidence' as nominal rather than exact.
+        """
+        if max_iterations < 2:
+            raise ValueError("Adaptive certification needs max_iterations >= 2")
+
+        n = min(max(min_iterations, 2), max_iterations)
+        n_looks = int(np.ceil((max_iterations - n) / batch_size)) + 1
+
+        # One-sided normal quantile at the per-look (alpha-spent) confidence
+        z = NormalDist().inv_cdf(1 - (1 - confidence) / n_looks)
+
+        trials = SystemValidator.collect_trials(n, seed, cache, precision=precision)
+
+        while True:
+            stats = SystemValidator._summarize(trials)
+
+            # Standard error of (mean - 3*sigma): Var(mean) = s^2/n, Var(s) ~ s^2/(2(n-1))
+            se = stats["std_dev"] * np.sqrt(1.0 / n + 9.0 / (2.0 * (n - 1)))
+            ci_low = stats["3_sigma_low"] - z * se
+            ci_high = stats["3_sigma_low"] + z * se
+
+            if ci_low >= REQ_THRESHOLD or ci_high < REQ_THRESHOLD or n >= max_iterations:
+                break
+
+            n = min(n + batch_size, max_iterations)
+            trials = SystemValidator.collect_trials(n, seed, cache, previous=trials, precision=precision)
+
+        stats.update({
+            "decision": "PASS" if stats["3_sigma_low"] >= REQ_THRESHOLD else "FAIL",
+            "settled": ci_low >= REQ_THRESHOLD or ci_high < REQ_THRESHOLD,
+            "confidence": confidence,
+            "n_looks": n_looks,
+            "ci_low": ci_low,
+            "ci_high": ci_high,
+            "trials_used": n,
+            "trials_saved": max_iterations - n,
+        })
+        return stats
+
+    @staticmethod
+    def run_campaign(iterations, seed=None, precision=np.float32, record_history=False, history_stride=10):
+        """
+        Compact campaign mode: all trial state, covariance and (decimated) history
+        is held in contiguous structure-of-arrays buffers at the chosen precision.
+        Returns (stats, buffers).
+        """
+        buffers = CampaignBuffers(iterations, MAX_STEPS, precision, record_history, history_stride)
+        for i in range(iterations):
+            rng = SystemValidator._trial_rng(seed, i)
+            buffers.accuracy[i], buffers.fuel[i] = SystemValidator._run_trial(rng, precision, buffers, i)
+
+        stats = SystemValidator._summarize({"accuracy": buffers.accuracy, "fuel": buffers.fuel})
+        return stats, buffers
+
+    @staticmethod
+    def compare_precision(iterations=200, seed=0, tolerance=0.05):
+        """
+        Accuracy check for the float32 mode: flies the same seeded trials in
+        float32 and float64 and compares the certification statistics.
+        'safe' means the 3-sigma bound moved by less than 'tolerance' (% points)
+        and the PASS/FAIL verdict is unchanged.
+        """
+        stats64, _ = SystemValidator.run_campaign(iterations, seed, np.float64)
+        stats32, _ = SystemValidator.run_campaign(iterations, seed, np.float32)
+
+        delta = {k: float(stats32[k] - stats64[k]) for k in ("mean", "std_dev", "3_sigma_low")}
+        same_verdict = (stats32["3_sigma_low"] >= REQ_THRESHOLD) == (stats64["3_sigma_low"] >= REQ_THRESHOLD)
+        return {
+            "float64": stats64,
+            "float32": stats32,
+            "delta": delta,
+            "max_trial_delta": float(np.max(np.abs(np.subtract(stats32["raw_data"], stats64["raw_data"])))),
+            "safe": same_verdict and abs(delta["3_sigma_low"]) < tolerance,
+        }